@@ -5,16 +5,18 @@ from typing import List, Optional
 from fastapi import APIRouter, Query, Depends, HTTPException
 from sqlalchemy.orm import Session
 
+from app.core.languages import supported_languages
 from app.core.palindrome import Palindrome
 from app.db import crud
 from app.db.base import get_db
-from app.schemas.enums import Language
+from app.schemas.enums import LanguageCode
 from app.schemas.palindrome import (
     PalindromeBase,
     PalindromeResponse,
     PalindromeQuery,
     PalindromeQueryById,
     PalindromeFull,
+    LanguageInfo,
     DeleteResponse
 )
 
@@ -31,13 +33,27 @@ async def root():
     return {"Test": "esmitt"}
 
 
+@router.get("/languages", response_model=List[LanguageInfo])
+async def get_languages():
+    """
+    List the supported languages.
+
+    The list comes from the registry of language rules,
+    so a newly registered language shows up here automatically.
+
+    Returns:
+    - List[LanguageInfo]: Code and name of each supported language
+    """
+    return [LanguageInfo(code=rules.code, name=rules.name) for rules in supported_languages()]
+
+
 @router.post("/detect/", response_model=PalindromeResponse)
 async def check_palindrome(palindrome: PalindromeBase, db: Session = Depends(get_db)):
     """
     Check if the provided text is a palindrome.
 
     This endpoint analyzes the input text to determine if it's a palindrome
-    according to the specified language rules (English or Spanish).
+    according to the rules of the specified language (see /languages).
     The result is stored in the database for future reference.
 
     Parameters:
@@ -61,7 +77,7 @@ async def check_palindrome(palindrome: PalindromeBase, db: Session = Depends(get
 @router.get("/detections", response_model=List[PalindromeQuery])
 async def get_detections_query(from_date: Optional[datetime] = Query(None, description="Filter by date (from)"),
                                to_date: Optional[datetime] = Query(None, description="Filter by date (to)"),
-                               language: Optional[Language] = Query(None, description="Filter by language (EN, ES)"),
+                               language: Optional[LanguageCode] = Query(None, description="Filter by language (see /languages)"),
                                db: Session = Depends(get_db)):
     """
     Retrieve palindrome detections with optional filters.
@@ -72,7 +88,7 @@ async def get_detections_query(from_date: Optional[datetime] = Query(None, descr
     Parameters:
     - from_date: Optional start date for filtering results
     - to_date: Optional end date for filtering results
-    - language: Optional language filter (en or es)
+    - language: Optional language filter (e.g. en or es)
     - db: Database session dependency
 
     Returns:
@@ -100,13 +116,16 @@ async def get_all(db: Session = Depends(get_db)):
     - List[PalindromeFull]: List of all stored records
     """
     all_records = crud.get_all(db=db)
-    logger.info(f"Retrieved {len(all_records)} records from database")
+    logger.info("Retrieved %d records from database", len(all_records))
+    # checked once, so the per-record debug call costs nothing when filtered out
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     results = []
     for record in all_records:
-        logger.debug(f"Processing record: id={record.id}, language={record.language}")
+        if debug_enabled:
+            logger.debug("Processing record: id=%s, language=%s", record.id, record.language)
         results.append(PalindromeFull(id=record.id,
                                       is_palindrome=record.is_palindrome,
-                                      language=Language(record.language),
+                                      language=record.language,
                                       text=record.text,
                                       timestamp=record.timestamp))
     logger.info("Successfully processed all records")
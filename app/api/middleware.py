@@ -0,0 +1,150 @@
+import json
+import logging
+import math
+import re
+from typing import Optional
+from uuid import uuid4
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import Settings, get_settings
+from app.core.logging_config import request_id_var
+from app.core.ratelimit import BucketLimit, RateLimitBackend, get_backend
+
+REQUEST_ID_HEADER = b"x-request-id"
+# ids sent by clients end up in every log record, anything else is replaced by a generated one
+VALID_REQUEST_ID = re.compile(rb"[A-Za-z0-9._-]{1,64}")
+
+# tokens taken by a request, keyed by (method, path); anything else costs DEFAULT_COST
+ENDPOINT_COSTS: dict[tuple[str, str], float] = {
+    ("GET", "/all"): 10,
+    ("GET", "/detections"): 3,
+    ("POST", "/detect/"): 2,
+}
+DEFAULT_COST: float = 1
+# upper bound for the Retry-After header, in seconds
+MAX_RETRY_AFTER = 60
+
+logger = logging.getLogger(__name__)
+
+
+class RequestIdMiddleware:
+    """
+    Tag every HTTP request with an id, so its log records can be correlated.
+
+    The id is taken from the incoming X-Request-ID header when it is present and
+    valid (at most 64 characters out of A-Z, a-z, 0-9, ".", "_" and "-"),
+    otherwise a new one is generated. It is echoed back in the response.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER:
+                if VALID_REQUEST_ID.fullmatch(value):
+                    request_id = value.decode("ascii")
+                break
+        request_id = request_id or uuid4().hex
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((REQUEST_ID_HEADER, request_id.encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
+
+
+class RateLimitMiddleware:
+    """
+    Admission control in front of the API.
+
+    A request is rejected with 429 (and a Retry-After header) when:
+    - this worker is already serving RATE_LIMIT_MAX_CONCURRENCY requests
+    - the client (by IP) ran out of tokens in its bucket
+    - the global bucket, shared by every client, ran out of tokens
+
+    Each endpoint takes its own number of tokens (see ENDPOINT_COSTS). Both
+    buckets are checked together: tokens are only taken when both have enough.
+    Both bursts must hold the most expensive request, otherwise it could never
+    be served: a ValueError is raised when the middleware is built.
+    """
+
+    def __init__(self,
+                 app: ASGIApp,
+                 settings: Optional[Settings] = None,
+                 backend: Optional[RateLimitBackend] = None,
+                 costs: Optional[dict[tuple[str, str], float]] = None):
+        self.app = app
+        self.settings = settings or get_settings()
+        self.backend = backend or get_backend(self.settings)
+        self.costs = ENDPOINT_COSTS if costs is None else costs
+        max_cost = max([DEFAULT_COST, *self.costs.values()])
+        for name in ("RATE_LIMIT_CLIENT_BURST", "RATE_LIMIT_GLOBAL_BURST"):
+            if getattr(self.settings, name) < max_cost:
+                raise ValueError(f"{name} must be at least {max_cost}, the cost of the most expensive request")
+        self.global_limit = BucketLimit("global",
+                                        self.settings.RATE_LIMIT_GLOBAL_BURST, self.settings.RATE_LIMIT_GLOBAL_RATE)
+        self.in_flight = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if self.in_flight >= self.settings.RATE_LIMIT_MAX_CONCURRENCY:
+            await self.reject(send, 1.0)
+            return
+
+        # the slot is taken before awaiting the backend, so concurrent requests cannot all pass the check above
+        self.in_flight += 1
+        try:
+            retry_after = await self.admit(scope)
+            if retry_after:
+                await self.reject(send, retry_after)
+                return
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+
+    async def admit(self, scope: Scope) -> float:
+        """Take the tokens of the request. Returns 0 when it is accepted, otherwise the seconds to wait."""
+        settings = self.settings
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        cost = self.costs.get((scope["method"], path), DEFAULT_COST)
+
+        client = scope.get("client")
+        client_limit = BucketLimit("client:" + (client[0] if client else "unknown"),
+                                   settings.RATE_LIMIT_CLIENT_BURST, settings.RATE_LIMIT_CLIENT_RATE)
+        return await self.backend.acquire((client_limit, self.global_limit), cost)
+
+    @staticmethod
+    async def reject(send: Send, retry_after: float) -> None:
+        retry_after = max(1, math.ceil(min(MAX_RETRY_AFTER, retry_after)))
+        logger.info("Request rejected by rate limiter, retry after %ds", retry_after)
+        body = json.dumps({"detail": "Too many requests"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
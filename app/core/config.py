@@ -7,7 +7,7 @@ from pydantic import BaseModel
 class Settings(BaseModel):
     # main settings
     APP_NAME: str = "Palindrome Detection API"
-    DESCRIPTION: str = "API for detecting and managing palindromes in English and Spanish"
+    DESCRIPTION: str = "API for detecting and managing palindromes in several languages"
     VERSION: str = "1.0.0"
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "production")
     DEBUG: bool = ENVIRONMENT == "development"
@@ -17,6 +17,36 @@ class Settings(BaseModel):
 
     API_PREFIX: str = "/api/v1"
 
+    # logging settings
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "DEBUG" if DEBUG else "INFO")
+    # per-module overrides, e.g. "app.api.endpoints=INFO,sqlalchemy.engine=WARNING"
+    LOG_LEVELS: str = os.getenv("LOG_LEVELS", "")
+    LOG_JSON: bool = os.getenv("LOG_JSON", "true").lower() == "true"
+    # fraction of DEBUG records that are actually emitted (1.0 keeps all of them)
+    LOG_DEBUG_SAMPLE_RATE: float = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "1.0"))
+    # records waiting to be written, newer ones are dropped when it is full
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+    # rate limiting settings (token buckets: RATE tokens per second, up to BURST)
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "memory")  # memory or redis
+    RATE_LIMIT_REDIS_URL: str = os.getenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+    RATE_LIMIT_CLIENT_RATE: float = float(os.getenv("RATE_LIMIT_CLIENT_RATE", "50"))
+    RATE_LIMIT_CLIENT_BURST: float = float(os.getenv("RATE_LIMIT_CLIENT_BURST", "100"))
+    RATE_LIMIT_GLOBAL_RATE: float = float(os.getenv("RATE_LIMIT_GLOBAL_RATE", "500"))
+    RATE_LIMIT_GLOBAL_BURST: float = float(os.getenv("RATE_LIMIT_GLOBAL_BURST", "1000"))
+    # requests served at the same time by this worker
+    RATE_LIMIT_MAX_CONCURRENCY: int = int(os.getenv("RATE_LIMIT_MAX_CONCURRENCY", "100"))
+
+    def module_log_levels(self) -> dict[str, str]:
+        levels = {}
+        for item in self.LOG_LEVELS.split(","):
+            if "=" not in item:
+                continue
+            module, level = item.split("=", 1)
+            levels[module.strip()] = level.strip().upper()
+        return levels
+
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -0,0 +1,84 @@
+import string
+from typing import Optional
+
+# characters skipped in every language
+IGNORED_CHARACTERS = string.punctuation + string.whitespace
+
+
+class LanguageRules:
+    """
+    How a language compares letters when checking for palindromes.
+
+    - folds: letter -> what it is compared as, e.g. "á" -> "a" or "ß" -> "ss"
+    - ignored: characters skipped on top of IGNORED_CHARACTERS, e.g. "¿¡"
+    - digraphs: letter pairs read as a single letter, e.g. "ny" -> "ñ",
+      so they are not reversed when the text is read backwards
+
+    Everything is compiled once into a str.translate() table, folding a text is
+    then a lowercase, one replace() per digraph and a single table lookup per character.
+    """
+
+    def __init__(self,
+                 code: str,
+                 name: str,
+                 folds: Optional[dict[str, str]] = None,
+                 ignored: str = "",
+                 digraphs: Optional[dict[str, str]] = None):
+        self.code = code
+        self.name = name
+        self.digraphs = tuple((digraph.lower(), unit) for digraph, unit in (digraphs or {}).items())
+
+        mapping: dict[str, Optional[str]] = {char: None for char in IGNORED_CHARACTERS + ignored}
+        for letter, folded in (folds or {}).items():
+            mapping[letter.lower()] = folded
+        self.table = str.maketrans(mapping)
+
+    def fold(self, text: str) -> str:
+        """Text reduced to the letters compared, in reading order."""
+        text = text.lower()
+        for digraph, unit in self.digraphs:
+            text = text.replace(digraph, unit)
+        return text.translate(self.table)
+
+
+_registry: dict[str, LanguageRules] = {}
+
+
+def register(rules: LanguageRules) -> LanguageRules:
+    _registry[rules.code] = rules
+    return rules
+
+
+def get_rules(code: str) -> LanguageRules:
+    try:
+        return _registry[code]
+    except KeyError:
+        raise ValueError(f"Unsupported language: {code}") from None
+
+
+def supported_languages() -> list[LanguageRules]:
+    return list(_registry.values())
+
+
+register(LanguageRules("en", "English"))
+register(LanguageRules("es", "Spanish",
+                       folds={"á": "a", "é": "e", "í": "i", "ó": "o", "ú": "u"},
+                       ignored="¿¡"))
+register(LanguageRules("pt", "Portuguese",
+                       folds={"á": "a", "à": "a", "â": "a", "ã": "a", "é": "e", "ê": "e", "í": "i",
+                              "ó": "o", "ô": "o", "õ": "o", "ú": "u", "ü": "u", "ç": "c"}))
+register(LanguageRules("fr", "French",
+                       folds={"à": "a", "â": "a", "æ": "ae", "ç": "c", "é": "e", "è": "e", "ê": "e",
+                              "ë": "e", "î": "i", "ï": "i", "ô": "o", "œ": "oe", "ù": "u", "û": "u",
+                              "ü": "u", "ÿ": "y"},
+                       ignored="«»"))
+register(LanguageRules("de", "German",
+                       folds={"ä": "a", "ö": "o", "ü": "u", "ß": "ss"},
+                       ignored="„“‚‘"))
+# ç and ñ stay letters of their own, "ny" is read as a single letter (the same as "ñ")
+# and the middle dot of "l·l" is skipped
+register(LanguageRules("ca", "Catalan",
+                       folds={"à": "a", "é": "e", "è": "e", "í": "i", "ï": "i", "ó": "o", "ò": "o",
+                              "ú": "u", "ü": "u", "ŀ": "l"},
+                       ignored="·¿¡«»",
+                       digraphs={"ny": "ñ"}))
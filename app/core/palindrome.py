@@ -1,44 +1,19 @@
-import string
-
-import unicodedata
+from typing import Union
 
+from app.core.languages import LanguageRules, get_rules
 from app.schemas.enums import Language
 
 
 class Palindrome:
 
-    def __init__(self, text: str, language: Language):
+    def __init__(self, text: str, language: Union[Language, str]):
         self.text: str = text
-        self.language: Language = language
-        self.punctuations: set[str] = set(string.punctuation + string.whitespace)
+        # a Language member or a code of any registered language
+        self.language: str = language.value if isinstance(language, Language) else language
+        self.rules: LanguageRules = get_rules(self.language)
 
     def is_palindrome(self) -> bool:
-        # 1) classic version:
-        # cleaned_text = ''.join(char.lower() for char in self.text if char.isalnum())
-        # return cleaned_text == cleaned_text[::-1]
-        # 2) two pointers approach to pass only once per letter
-        left, right = 0, len(self.text) - 1
-        while left < right:
-            # skip blank spaces, \n\r and punctuations
-            while left < right and (self.text[left] in self.punctuations):
-                left += 1
-
-            while left < right and (self.text[right] in self.punctuations):
-                right -= 1
-
-            left_char = self.text[left].lower()
-            right_char = self.text[right].lower()
-
-            # replace accents with non-accent vowels
-            if self.language == Language.ES:
-                if left_char in "áéíóú":
-                    left_char = unicodedata.normalize('NFD', left_char)[0]
-                if right_char in "áéíóú":
-                    right_char = unicodedata.normalize('NFD', right_char)[0]
-
-            if left_char != right_char:
-                return False
-
-            left += 1
-            right -= 1
-        return True
+        # the text is folded with the precompiled table of its language (punctuation removed,
+        # accents replaced, digraphs merged), then compared with its reverse in C
+        folded_text = self.rules.fold(self.text)
+        return folded_text == folded_text[::-1]
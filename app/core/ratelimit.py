@@ -0,0 +1,183 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Protocol, Sequence
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class BucketLimit(NamedTuple):
+    key: str
+    capacity: float
+    rate: float
+
+
+class TokenBucket:
+    """
+    Classic token bucket: holds up to `capacity` tokens, refilled at `rate` tokens per second.
+
+    Refill is computed lazily when the bucket is used, so an idle bucket costs nothing.
+    """
+
+    __slots__ = ("capacity", "rate", "tokens", "updated")
+
+    def __init__(self, capacity: float, rate: float, now: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, cost: float) -> float:
+        """Seconds until `cost` tokens are available, 0 if they already are."""
+        if self.tokens >= cost:
+            return 0.0
+        if cost > self.capacity or self.rate <= 0:
+            return float("inf")
+        return (cost - self.tokens) / self.rate
+
+    def take(self, cost: float, now: float) -> float:
+        """Take `cost` tokens. Returns 0 on success, otherwise the seconds to wait before retrying."""
+        self.refill(now)
+        retry_after = self.wait_time(cost)
+        if not retry_after:
+            self.tokens -= cost
+        return retry_after
+
+
+class RateLimitBackend(Protocol):
+    async def acquire(self, limits: Sequence[BucketLimit], cost: float) -> float:
+        """
+        Take `cost` tokens from every bucket in `limits`, or from none of them.
+
+        Returns 0 on success, otherwise the seconds to wait before retrying.
+        """
+        ...
+
+
+class InMemoryBackend:
+    """
+    Buckets kept in a dict of this process.
+
+    Good for a single worker. With several workers every one of them enforces
+    its own limits, use RedisBackend to share them.
+
+    At most `max_keys` buckets are kept, the least recently used one is dropped
+    to make room (its owner simply starts again with a full bucket).
+    """
+
+    def __init__(self, max_keys: int = 10_000):
+        self.buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self.max_keys = max_keys
+
+    async def acquire(self, limits: Sequence[BucketLimit], cost: float) -> float:
+        now = time.monotonic()
+        buckets = [self._get_bucket(limit, now) for limit in limits]
+        retry_after = 0.0
+        for bucket in buckets:
+            bucket.refill(now)
+            retry_after = max(retry_after, bucket.wait_time(cost))
+        if not retry_after:
+            for bucket in buckets:
+                bucket.tokens -= cost
+        return retry_after
+
+    def _get_bucket(self, limit: BucketLimit, now: float) -> TokenBucket:
+        bucket = self.buckets.get(limit.key)
+        if bucket is not None:
+            self.buckets.move_to_end(limit.key)
+            return bucket
+        if len(self.buckets) >= self.max_keys:
+            self.buckets.popitem(last=False)
+        bucket = self.buckets[limit.key] = TokenBucket(limit.capacity, limit.rate, now)
+        return bucket
+
+
+# KEYS = bucket keys, ARGV = cost, now (seconds), then capacity and rate of each key
+TOKEN_BUCKET_SCRIPT = """
+local cost = tonumber(ARGV[1])
+local now = tonumber(ARGV[2])
+local tokens = {}
+local retry_after = 0
+
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[2 * i + 1])
+    local rate = tonumber(ARGV[2 * i + 2])
+    local state = redis.call('HMGET', key, 'tokens', 'updated')
+    local available = tonumber(state[1]) or capacity
+    local updated = tonumber(state[2]) or now
+    available = math.min(capacity, available + math.max(0, now - updated) * rate)
+    tokens[i] = available
+
+    if available < cost then
+        if cost > capacity or rate <= 0 then
+            retry_after = -1
+        elseif retry_after >= 0 then
+            retry_after = math.max(retry_after, (cost - available) / rate)
+        end
+    end
+end
+
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[2 * i + 1])
+    local rate = tonumber(ARGV[2 * i + 2])
+    if retry_after == 0 then
+        tokens[i] = tokens[i] - cost
+    end
+    redis.call('HSET', key, 'tokens', tostring(tokens[i]), 'updated', tostring(now))
+    if rate > 0 then
+        redis.call('EXPIRE', key, math.ceil(capacity / rate) + 1)
+    end
+end
+return tostring(retry_after)
+"""
+
+
+class RedisBackend:
+    """
+    Buckets stored in Redis, shared by every worker pointing to the same server.
+
+    Each acquire() is a single round trip running a Lua script, so checking and
+    taking from all the buckets is atomic. Workers are expected to have
+    reasonably synchronized clocks (the wall clock is sent along).
+
+    When Redis cannot be reached requests are let through (and a warning is
+    logged): an outage of the limiter should not take the API down with it.
+    """
+
+    def __init__(self, client: aioredis.Redis, prefix: str = "ratelimit:"):
+        self.client = client
+        self.prefix = prefix
+        self.script = client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBackend":
+        return cls(aioredis.Redis.from_url(url))
+
+    async def acquire(self, limits: Sequence[BucketLimit], cost: float) -> float:
+        args = [cost, time.time()]
+        for limit in limits:
+            args.extend((limit.capacity, limit.rate))
+        try:
+            result = float(await self.script(keys=[self.prefix + limit.key for limit in limits], args=args))
+        except RedisError as exc:
+            logger.warning("Rate limit backend unavailable, request let through: %s", exc)
+            return 0.0
+        return float("inf") if result < 0 else result
+
+
+def get_backend(settings: Optional[Settings] = None) -> RateLimitBackend:
+    settings = settings or get_settings()
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return RedisBackend.from_url(settings.RATE_LIMIT_REDIS_URL)
+    if settings.RATE_LIMIT_BACKEND == "memory":
+        return InMemoryBackend()
+    raise ValueError(f"Unknown rate limit backend: {settings.RATE_LIMIT_BACKEND}")
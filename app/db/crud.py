@@ -4,7 +4,6 @@ from typing import Optional, Type
 from sqlalchemy import cast, String, Boolean, Integer
 from sqlalchemy.orm import Session
 
-from app.core.palindrome import Language
 from app.db.models import PalindromeRecord
 from app.schemas.palindrome import PalindromeBase, PalindromeQuery
 
@@ -14,7 +13,7 @@ def insert_detection(db: Session,
                      is_palindrome: bool) -> PalindromeRecord:
     # the timestamp is set at this point
     db_item = PalindromeRecord(text=palindrome.text,
-                               language=palindrome.language.value,
+                               language=palindrome.language,
                                is_palindrome=is_palindrome)
     db.add(db_item)
     db.commit()
@@ -23,7 +22,7 @@ def insert_detection(db: Session,
 
 
 def get_detections(db: Session,
-                   language: Optional[Language] = None,
+                   language: Optional[str] = None,
                    from_date: Optional[datetime] = None,
                    to_date: Optional[datetime] = None) -> list[PalindromeQuery]:
     query = db.query(PalindromeRecord)
@@ -32,7 +31,7 @@ def get_detections(db: Session,
     query = query.where(cast(PalindromeRecord.is_palindrome, Boolean) == True)
 
     if language:
-        query = query.filter(cast(PalindromeRecord.language, String) == language.value)
+        query = query.filter(cast(PalindromeRecord.language, String) == language)
     if from_date:
         query = query.filter(PalindromeRecord.timestamp >= from_date)
     if to_date:
@@ -44,7 +43,7 @@ def get_detections(db: Session,
             id=record.id,
             text=record.text,
             timestamp=record.timestamp,
-            language=Language(record.language)
+            language=record.language
         ))
     return result
 
@@ -8,15 +8,18 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.api.endpoints import router as api_router
+from app.api.middleware import RateLimitMiddleware, RequestIdMiddleware
 from app.db.base import get_engine, init_db
 from app.db.models import Base
 from app.core.config import get_settings
+from app.core.logging_config import setup_logging, stop_logging
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # logging is configured here, not at import time, so importing the app has no side effects
+    setup_logging()
     # init the database at startup
     engine = get_engine()
     print("Initializing database...")
@@ -25,6 +28,7 @@ async def lifespan(app: FastAPI):
     yield
     # clean up
     print("Application is shutting down. Cleaning up resources...")
+    stop_logging()
 
 
 app = FastAPI(
@@ -36,6 +40,10 @@ app = FastAPI(
 )
 
 app.include_router(api_router)
+if get_settings().RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware)
+# added last so it wraps everything else, rejected requests get an id too
+app.add_middleware(RequestIdMiddleware)
 
 # Handle any SQLAlchemy-related errors globally
 @app.exception_handler(SQLAlchemyError)
@@ -1,6 +1,20 @@
 from enum import Enum
+from typing import Annotated
 
+from pydantic import AfterValidator
 
-class Language(Enum):
-    EN = "en"
-    ES = "es"
+from app.core.languages import get_rules, supported_languages
+
+# languages registered when this module is imported (e.g. Language.EN == Language("en")),
+# handy to refer to them in code; the API itself validates against the registry (see LanguageCode)
+Language = Enum("Language", {rules.code.upper(): rules.code for rules in supported_languages()})
+
+
+def check_language(code: str) -> str:
+    # raises ValueError (a 422 for the API) when no rules are registered for the code
+    get_rules(code)
+    return code
+
+
+# language code accepted by the API: any language registered, even after startup
+LanguageCode = Annotated[str, AfterValidator(check_language)]
@@ -2,18 +2,18 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
-from app.schemas.enums import Language
+from app.schemas.enums import LanguageCode
 
 
 class PalindromeBase(BaseModel):
     text: str = Field(..., min_length=1, description="Text to check if is palindrome. This will be stored")
-    language: Language = Field(default=Language.EN, description="Language of the text (EN, ES)")
+    language: LanguageCode = Field(default="en", description="Language code of the text (see /languages)")
 
 
 class PalindromeId(BaseModel):
     id: int
     timestamp: datetime
-    language: Language
+    language: str
 
 
 class PalindromeResponse(PalindromeId):
@@ -39,6 +39,11 @@ class PalindromeFull(PalindromeId):
 # class PalindromeSchema(PalindromeBase):
 #     pass
 
+class LanguageInfo(BaseModel):
+    code: str
+    name: str
+
+
 class DeleteResponse(BaseModel):
     success: bool
     message: str
@@ -0,0 +1,52 @@
+"""
+Detection time per language, before and after registering many extra languages.
+
+Rules are looked up by code in a dict, so the time for a language should not
+change when others are added.
+
+Usage (from the project root):
+    python -m benchmarks.bench_languages [--number 20000] [--extra 100]
+"""
+import argparse
+import timeit
+
+from app.core.languages import LanguageRules, register
+from app.core.palindrome import Palindrome
+from app.schemas.enums import Language
+
+SAMPLES = {
+    Language.EN: "Able was I ere I saw Elba",
+    Language.ES: "Dábale arroz a la zorra el abad",
+    Language.PT: "Socorram-me, subi no ônibus em Marrocos",
+    Language.FR: "Ésope reste ici et se repose",
+    Language.DE: "Ein Neger mit Gazelle zagt im Regen nie",
+    Language.CA: "Col·loc",
+}
+
+
+def measure(number: int) -> dict[Language, float]:
+    timings = {}
+    for language, text in SAMPLES.items():
+        seconds = min(timeit.repeat(lambda: Palindrome(text, language).is_palindrome(), number=number, repeat=5))
+        timings[language] = seconds / number * 1e9
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20000, help="detections per measurement")
+    parser.add_argument("--extra", type=int, default=100, help="synthetic languages to register")
+    args = parser.parse_args()
+
+    before = measure(args.number)
+    for i in range(args.extra):
+        register(LanguageRules(f"x{i}", f"Synthetic {i}", folds={chr(0x4E00 + i): "a"}, digraphs={"qq": "q"}))
+    after = measure(args.number)
+
+    print(f"{'language':<10}{'before (ns)':>14}{f'+{args.extra} languages (ns)':>26}")
+    for language in SAMPLES:
+        print(f"{language.value:<10}{before[language]:>14.0f}{after[language]:>26.0f}")
+
+
+if __name__ == "__main__":
+    main()
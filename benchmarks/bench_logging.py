@@ -0,0 +1,94 @@
+"""
+Latency of GET /all with logging enabled vs. disabled.
+
+Usage (from the project root):
+    python -m benchmarks.bench_logging [--records 1000] [--requests 200]
+"""
+import argparse
+import logging
+import statistics
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from app.api.endpoints import router as api_router
+from app.api.middleware import RequestIdMiddleware
+from app.core.config import Settings
+from app.core.logging_config import setup_logging, stop_logging
+from app.db.base import get_db, get_session_local, init_db
+from app.db.models import Base, PalindromeRecord
+
+
+def build_client(records: int) -> TestClient:
+    # same routes and request ids as app.main, but without the rate limiter:
+    # it would turn most of the timed requests into 429 rejections
+    app = FastAPI()
+    app.include_router(api_router)
+    app.add_middleware(RequestIdMiddleware)
+
+    engine = create_engine("sqlite:///", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    init_db(engine, Base)
+    session_local = get_session_local(engine)
+
+    with session_local() as db:
+        db.add_all(PalindromeRecord(text=f"text {i}", language="en", is_palindrome=i % 2 == 0)
+                   for i in range(records))
+        db.commit()
+
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+def measure(client: TestClient, requests: int) -> list[float]:
+    client.get("/all")  # warm up
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get("/all")
+        timings.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, f"GET /all returned {response.status_code}"
+    return timings
+
+
+def report(label: str, timings: list[float]) -> None:
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{label:<28} mean={statistics.mean(timings):7.2f}ms  "
+          f"p50={statistics.median(timings):7.2f}ms  p95={p95:7.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    client = build_client(args.records)
+    scenarios = [
+        ("logging off", None),
+        ("INFO", Settings(LOG_LEVEL="INFO")),
+        ("DEBUG, 1% sampled", Settings(LOG_LEVEL="DEBUG", LOG_DEBUG_SAMPLE_RATE=0.01)),
+        ("DEBUG, all records", Settings(LOG_LEVEL="DEBUG")),
+    ]
+    for label, settings in scenarios:
+        if settings is None:
+            logging.disable(logging.CRITICAL)
+        else:
+            logging.disable(logging.NOTSET)
+            setup_logging(settings)
+        report(label, measure(client, args.requests))
+        stop_logging()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,8 @@ from sqlalchemy.pool import StaticPool
 from sqlalchemy.orm.session import Session
 from datetime import datetime, timedelta
 
+from app.core import languages
+from app.core.languages import LanguageRules, register
 from app.main import app
 from app.db.models import Base  # Base from models (to work with the tests)
 from app.db.base import init_db, get_session_local, get_db
@@ -48,6 +50,41 @@ def test_root_endpoint():
     assert response.status_code == 200
     assert "Test" in response.json()
 
+def test_get_languages():
+    response = client.get("/languages")
+    assert response.status_code == 200
+    codes = [language["code"] for language in response.json()]
+    assert {"en", "es", "pt", "fr", "de", "ca"} <= set(codes)
+
+def test_detect_every_advertised_language(setup_database):
+    for language in client.get("/languages").json():
+        response = client.post("/detect/", json={"text": ENGLISH_PALINDROME, "language": language["code"]})
+        assert response.status_code == 200
+        assert response.json()["language"] == language["code"]
+        response = client.get(f"/detections?language={language['code']}")
+        assert response.status_code == 200
+
+def test_language_registered_at_runtime(setup_database, monkeypatch):
+    # registered after the app was imported: listed and accepted right away
+    monkeypatch.setattr(languages, "_registry", dict(languages._registry))
+    register(LanguageRules("it", "Italian", folds={"à": "a", "è": "e", "é": "e", "ì": "i", "ò": "o", "ù": "u"}))
+    assert "it" in [language["code"] for language in client.get("/languages").json()]
+
+    response = client.post("/detect/", json={"text": "I topi non avevano nipoti", "language": "it"})
+    assert response.status_code == 200
+    assert response.json()["language"] == "it"
+    assert response.json()["is_palindrome"] is True
+
+    response = client.get("/detections?language=it")
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+def test_unknown_language_is_rejected():
+    response = client.post("/detect/", json={"text": ENGLISH_PALINDROME, "language": "xx"})
+    assert response.status_code == 422
+    response = client.get("/detections?language=xx")
+    assert response.status_code == 422
+
 def test_detect_palindrome_english(setup_database):
     user = {
             "text": ENGLISH_PALINDROME,
@@ -0,0 +1,116 @@
+import json
+import logging
+import queue
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import Settings
+from app.core.logging_config import (
+    DebugSamplingFilter,
+    DeferredQueueHandler,
+    JsonFormatter,
+    RequestIdFilter,
+    request_id_var,
+    setup_logging,
+    stop_logging,
+)
+from app.main import app
+
+client = TestClient(app)
+
+
+def make_record(level=logging.INFO, msg="hello %s", args=("world",)):
+    return logging.LogRecord("app.test", level, __file__, 1, msg, args, None)
+
+
+def test_json_formatter_includes_request_id():
+    record = make_record()
+    token = request_id_var.set("abc123")
+    try:
+        RequestIdFilter().filter(record)
+    finally:
+        request_id_var.reset(token)
+    data = json.loads(JsonFormatter().format(record))
+    assert data["message"] == "hello world"
+    assert data["request_id"] == "abc123"
+    assert data["level"] == "INFO"
+    assert data["logger"] == "app.test"
+
+
+def test_debug_sampling_filter():
+    drop_all = DebugSamplingFilter(0.0)
+    assert drop_all.filter(make_record(logging.DEBUG)) is False
+    # other levels are never sampled out
+    assert drop_all.filter(make_record(logging.INFO)) is True
+    assert DebugSamplingFilter(1.0).filter(make_record(logging.DEBUG)) is True
+
+
+def test_module_log_levels():
+    settings = Settings(LOG_LEVELS="app.api.endpoints=info, sqlalchemy.engine=WARNING,broken")
+    assert settings.module_log_levels() == {"app.api.endpoints": "INFO", "sqlalchemy.engine": "WARNING"}
+
+
+def queue_handlers():
+    return [handler for handler in logging.getLogger().handlers if isinstance(handler, DeferredQueueHandler)]
+
+
+@pytest.fixture
+def restore_logging():
+    # requested before capsys, so it is torn down after the capture ends
+    root = logging.getLogger()
+    level = root.level
+    yield
+    stop_logging()
+    root.setLevel(level)
+
+
+def test_setup_logging_writes_json_in_background(restore_logging, capsys):
+    setup_logging(Settings(LOG_LEVEL="INFO", LOG_LEVELS="app.quiet=ERROR", LOG_JSON=True))
+    logging.getLogger("app.loud").info("visible %d", 1)
+    logging.getLogger("app.quiet").warning("hidden")
+    stop_logging()  # flushes the queue
+    lines = [json.loads(line) for line in capsys.readouterr().err.splitlines()]
+    assert [line["message"] for line in lines] == ["visible 1"]
+
+
+def test_stop_logging_detaches_queue(restore_logging):
+    previous_handlers = logging.getLogger().handlers[:]
+    setup_logging()
+    assert len(queue_handlers()) == 1
+    stop_logging()
+    assert queue_handlers() == []
+    assert logging.getLogger().handlers == previous_handlers
+
+
+def test_full_queue_drops_records():
+    handler = DeferredQueueHandler(queue.Queue(maxsize=1))
+    handler.handle(make_record())
+    handler.handle(make_record())
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
+
+
+def test_lifespan_configures_and_restores_logging(restore_logging, monkeypatch):
+    # only the logging part of the lifespan is under test here
+    monkeypatch.setattr("app.main.init_db", lambda engine, base: None)
+    assert queue_handlers() == []
+    with TestClient(app) as lifespan_client:
+        assert len(queue_handlers()) == 1
+        assert lifespan_client.get("/").status_code == 200
+    assert queue_handlers() == []
+
+
+def test_request_id_header_roundtrip():
+    response = client.get("/", headers={"X-Request-ID": "my-request"})
+    assert response.headers["X-Request-ID"] == "my-request"
+    # a new id is generated when the client does not send one
+    response = client.get("/")
+    assert len(response.headers["X-Request-ID"]) == 32
+
+
+@pytest.mark.parametrize("request_id", ["x" * 65, "bad id", "id\u00e9", "<script>"])
+def test_invalid_request_id_is_replaced(request_id):
+    response = client.get("/", headers={"X-Request-ID": request_id.encode("latin-1")})
+    assert response.headers["X-Request-ID"] != request_id
+    assert len(response.headers["X-Request-ID"]) == 32
@@ -1,3 +1,6 @@
+import pytest
+
+from app.core.languages import get_rules, supported_languages
 from app.core.palindrome import Palindrome, Language
 
 def test_non_palindrome_english():
@@ -35,4 +38,44 @@ def test_palindrome_spanish():
     text = "    á     b    @#$$%$$%^&* a"
     assert Palindrome(text, Language.ES).is_palindrome() == True
     text = "ñoyoñ"
-    assert Palindrome(text, Language.ES).is_palindrome() == True
\ No newline at end of file
+    assert Palindrome(text, Language.ES).is_palindrome() == True
+
+def test_palindrome_portuguese():
+    text = "Socorram-me, subi no ônibus em Marrocos"
+    assert Palindrome(text, Language.PT).is_palindrome() == True
+    assert Palindrome("çac", Language.PT).is_palindrome() == True
+
+def test_palindrome_french():
+    text = "Ésope reste ici et se repose"
+    assert Palindrome(text, Language.FR).is_palindrome() == True
+    text = "« À l'étape, épate-la »"
+    assert Palindrome(text, Language.FR).is_palindrome() == True
+    # œ is compared as "oe"
+    assert Palindrome("œ eo", Language.FR).is_palindrome() == True
+    assert Palindrome("œ eo", Language.EN).is_palindrome() == False
+
+def test_palindrome_german():
+    text = "Ein Neger mit Gazelle zagt im Regen nie"
+    assert Palindrome(text, Language.DE).is_palindrome() == True
+    # ß is compared as "ss", umlauts as the plain vowel
+    assert Palindrome("Maß Sam", Language.DE).is_palindrome() == True
+    assert Palindrome("Ötto", Language.DE).is_palindrome() == True
+    assert Palindrome("Ötto", Language.EN).is_palindrome() == False
+
+def test_palindrome_catalan():
+    # the middle dot of l·l is skipped
+    assert Palindrome("Col·loc", Language.CA).is_palindrome() == True
+    # ny is a single letter, ç is not a c
+    assert Palindrome("anya", Language.CA).is_palindrome() == True
+    assert Palindrome("anya", Language.ES).is_palindrome() == False
+    assert Palindrome("çac", Language.CA).is_palindrome() == False
+
+def test_languages_match_registry():
+    codes = {rules.code for rules in supported_languages()}
+    assert {language.value for language in Language} == codes
+    for language in Language:
+        assert Palindrome("a", language).is_palindrome() == True
+
+def test_unknown_language():
+    with pytest.raises(ValueError):
+        get_rules("xx")
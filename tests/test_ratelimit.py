@@ -0,0 +1,177 @@
+import asyncio
+
+import fakeredis
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.middleware import RateLimitMiddleware
+from app.core.config import Settings
+from app.core.ratelimit import BucketLimit, InMemoryBackend, RedisBackend, TokenBucket, get_backend
+
+
+def make_client(backend=None, costs=None, **limits) -> TestClient:
+    settings = Settings(**{"RATE_LIMIT_CLIENT_RATE": 1, "RATE_LIMIT_CLIENT_BURST": 5,
+                           "RATE_LIMIT_GLOBAL_RATE": 100, "RATE_LIMIT_GLOBAL_BURST": 100, **limits})
+    app = FastAPI()
+
+    @app.get("/all")
+    async def get_all():
+        return []
+
+    @app.get("/detections/{detection_id}")
+    async def get_detection(detection_id: int):
+        return {"id": detection_id}
+
+    app.add_middleware(RateLimitMiddleware, settings=settings, backend=backend or InMemoryBackend(),
+                       costs={("GET", "/all"): 5} if costs is None else costs)
+    return TestClient(app)
+
+
+def test_token_bucket_refill():
+    bucket = TokenBucket(capacity=2, rate=1, now=0.0)
+    assert bucket.take(1, now=0.0) == 0
+    assert bucket.take(1, now=0.0) == 0
+    assert bucket.take(1, now=0.0) == pytest.approx(1.0)
+    # half a second later half a token is back
+    assert bucket.take(1, now=0.5) == pytest.approx(0.5)
+    assert bucket.take(1, now=1.0) == 0
+    # a request bigger than the bucket can never be served
+    assert bucket.take(3, now=100.0) == float("inf")
+
+
+def test_in_memory_backend_evicts_least_recently_used():
+    backend = InMemoryBackend(max_keys=2)
+    limit = BucketLimit("a", capacity=1, rate=0)
+    asyncio.run(backend.acquire([limit], 1))
+    asyncio.run(backend.acquire([limit._replace(key="b")], 1))
+    asyncio.run(backend.acquire([limit], 1))  # "a" is now the most recent
+    asyncio.run(backend.acquire([limit._replace(key="c")], 1))
+    assert list(backend.buckets) == ["a", "c"]
+
+
+def test_in_memory_backend_takes_all_or_nothing():
+    backend = InMemoryBackend()
+    client_limit = BucketLimit("client", capacity=5, rate=0)
+    global_limit = BucketLimit("global", capacity=1, rate=0)
+    assert asyncio.run(backend.acquire([client_limit, global_limit], 1)) == 0
+    for _ in range(3):
+        assert asyncio.run(backend.acquire([client_limit, global_limit], 1)) > 0
+    # the rejected requests did not take anything from the client bucket
+    assert backend.buckets["client"].tokens == 4
+
+
+def test_client_limit_and_endpoint_costs():
+    client = make_client()
+    # a detection lookup costs 1 token, /all costs 5
+    for detection_id in range(5):
+        assert client.get(f"/detections/{detection_id}").status_code == 200
+    response = client.get("/detections/1")
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+    assert response.json() == {"detail": "Too many requests"}
+
+    client = make_client()
+    assert client.get("/all").status_code == 200
+    response = client.get("/all")
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "5"
+
+
+def test_global_rejection_does_not_charge_client():
+    backend = InMemoryBackend()
+    client = make_client(backend=backend, costs={}, RATE_LIMIT_GLOBAL_RATE=0.001, RATE_LIMIT_GLOBAL_BURST=1)
+    statuses = [client.get("/detections/1").status_code for _ in range(4)]
+    assert statuses == [200, 429, 429, 429]
+    assert backend.buckets["client:testclient"].tokens == pytest.approx(4, abs=0.1)
+
+
+def test_global_limit():
+    client = make_client(costs={}, RATE_LIMIT_GLOBAL_RATE=1, RATE_LIMIT_GLOBAL_BURST=2)
+    assert client.get("/detections/1").status_code == 200
+    assert client.get("/detections/1").status_code == 200
+    assert client.get("/detections/1").status_code == 429
+
+
+def test_concurrency_limit():
+    client = make_client(RATE_LIMIT_MAX_CONCURRENCY=0)
+    response = client.get("/detections/1")
+    assert response.status_code == 429
+    assert "Retry-After" in response.headers
+
+
+class SlowBackend:
+    """Accepts everything, but only after a network-like delay."""
+
+    async def acquire(self, limits, cost):
+        await asyncio.sleep(0.01)
+        return 0.0
+
+
+def test_concurrency_limit_with_slow_backend():
+    app = FastAPI()
+
+    @app.get("/detections/{detection_id}")
+    async def get_detection(detection_id: int):
+        return {"id": detection_id}
+
+    app.add_middleware(RateLimitMiddleware, settings=Settings(RATE_LIMIT_MAX_CONCURRENCY=2), backend=SlowBackend())
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(*(client.get(f"/detections/{i}") for i in range(10)))
+        return [response.status_code for response in responses]
+
+    statuses = asyncio.run(scenario())
+    assert statuses.count(200) == 2
+    assert statuses.count(429) == 8
+
+
+def test_burst_smaller_than_a_request_is_rejected():
+    with pytest.raises(ValueError, match="RATE_LIMIT_CLIENT_BURST"):
+        RateLimitMiddleware(FastAPI(), settings=Settings(RATE_LIMIT_CLIENT_BURST=5), backend=InMemoryBackend())
+    with pytest.raises(ValueError, match="RATE_LIMIT_GLOBAL_BURST"):
+        RateLimitMiddleware(FastAPI(), settings=Settings(RATE_LIMIT_GLOBAL_BURST=1), backend=InMemoryBackend(),
+                            costs={("GET", "/all"): 2})
+
+
+def test_get_backend():
+    assert isinstance(get_backend(Settings(RATE_LIMIT_BACKEND="memory")), InMemoryBackend)
+    with pytest.raises(ValueError):
+        get_backend(Settings(RATE_LIMIT_BACKEND="nope"))
+
+
+def test_redis_backend():
+    server = fakeredis.FakeServer()
+    # two workers sharing the same server see the same buckets
+    worker_a = RedisBackend(fakeredis.FakeAsyncRedis(server=server))
+    worker_b = RedisBackend(fakeredis.FakeAsyncRedis(server=server))
+    client_1 = BucketLimit("client:1", capacity=3, rate=0.001)
+    client_2 = BucketLimit("client:2", capacity=3, rate=0.001)
+    global_limit = BucketLimit("global", capacity=4, rate=0.001)
+
+    async def scenario():
+        assert await worker_a.acquire([client_1, global_limit], 2) == 0
+        assert await worker_b.acquire([client_1, global_limit], 1) == 0
+        assert await worker_a.acquire([client_1, global_limit], 1) > 0
+        assert await worker_b.acquire([client_1, global_limit], 5) == float("inf")
+        # global has 1 token left: client 2 is rejected without being charged
+        assert await worker_b.acquire([client_2, global_limit], 2) > 0
+        assert await worker_b.acquire([client_2], 3) == 0
+
+    asyncio.run(scenario())
+
+
+def test_redis_backend_fails_open():
+    server = fakeredis.FakeServer()
+    server.connected = False
+    backend = RedisBackend(fakeredis.FakeAsyncRedis(server=server))
+    assert asyncio.run(backend.acquire([BucketLimit("client:1", capacity=1, rate=1)], 5)) == 0
+
+
+def test_middleware_with_redis_backend():
+    client = make_client(backend=RedisBackend(fakeredis.FakeAsyncRedis()))
+    assert client.get("/all").status_code == 200
+    assert client.get("/all").status_code == 429